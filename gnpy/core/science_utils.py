@@ -19,7 +19,7 @@ from logging import getLogger
 from math import isclose, factorial
 from numpy import interp, pi, zeros, cos, array, append, ones, exp, arange, sqrt, trapz, arcsinh, clip, abs, sum, \
     concatenate, flip, outer, inner, transpose, max, format_float_scientific, diag, sort, unique, argsort, cumprod, \
-    polyfit, log, reshape, swapaxes, full, nan, cumsum
+    polyfit, log, reshape, swapaxes, full, nan, cumsum, diff
 from scipy.constants import k, h
 from scipy.interpolate import interp1d
 
@@ -588,10 +588,13 @@ class NliSolver:
     @staticmethod
     def _generalized_rho_nli(delta_beta, rho_pump, z, alpha):
         w = 1j * delta_beta - alpha
-        generalized_rho_nli = (rho_pump[-1]**2 * exp(w * z[-1]) - rho_pump[0]**2 * exp(w * z[0])) / w
-        for z_ind in range(0, len(z) - 1):
-            derivative_rho = (rho_pump[z_ind + 1]**2 - rho_pump[z_ind]**2) / (z[z_ind + 1] - z[z_ind])
-            generalized_rho_nli -= derivative_rho * (exp(w * z[z_ind + 1]) - exp(w * z[z_ind])) / (w**2)
+        # exp(w * z) evaluated at once on the whole (frequency, z) grid; the piecewise-linear rho^2 contributions
+        # of all the z steps are then summed with a single matrix-vector product
+        exp_wz = exp(outer(w, z))
+        rho_pump_square = rho_pump**2
+        derivative_rho = diff(rho_pump_square) / diff(z)
+        generalized_rho_nli = (rho_pump_square[-1] * exp_wz[:, -1] - rho_pump_square[0] * exp_wz[:, 0]) / w
+        generalized_rho_nli -= diff(exp_wz, axis=1) @ derivative_rho / (w**2)
         generalized_rho_nli = abs(generalized_rho_nli)**2
         return generalized_rho_nli
 
@@ -15,8 +15,11 @@ Run with: streamlit run tutorial_prototype/app.py
 
 import streamlit as st
 import plotly.graph_objects as go
+from collections import Counter, namedtuple
+from copy import deepcopy
 from pathlib import Path
-from numpy import mean
+import numpy as np
+import pandas as pd
 
 from gnpy.core.elements import Transceiver, Fiber, RamanFiber, Edfa, Roadm, Fused
 from gnpy.core.parameters import SimParams
@@ -41,25 +44,40 @@ NETWORKS = {
 }
 
 
+# Loaded example network, along with its transceivers indexed once at load time
+_CachedNetwork = namedtuple('_CachedNetwork', 'equipment network transceivers trx_uids')
+
+# Display name per element class, looked up on the exact type (RamanFiber is not reported as Fiber)
+_TYPE_NAME = {cls: cls.__name__ for cls in (Transceiver, Fiber, RamanFiber, Edfa, Roadm, Fused)}
+
+
 def _element_type_name(node):
     """Return a human-readable type name for a network element."""
-    for cls in (Transceiver, Fiber, RamanFiber, Edfa, Roadm, Fused):
-        if isinstance(node, cls):
-            return cls.__name__
-    return type(node).__name__
+    return _TYPE_NAME.get(type(node), type(node).__name__)
+
+
+@st.cache_resource
+def _load_equipment_cached(equipment_path):
+    """Load an equipment library once per file path (as a str); examples sharing a library share the result.
 
+    Uses st.cache_resource, so the library survives reruns and is shared across sessions.
+    The result must not be mutated: simulations work on a deep copy of it.
+    """
+    return load_equipments_and_configs(Path(equipment_path), [], [])
 
+
+@st.cache_resource
 def _load_network_cached(network_key):
-    """Load equipment and network for a given example key. Uses st.cache_resource to avoid reloading."""
+    """Load equipment and network for a given example key. Uses st.cache_resource to avoid reloading.
+
+    The returned objects are shared across reruns and sessions: callers that mutate them
+    (e.g. network design) must work on a deep copy.
+    """
     info = NETWORKS[network_key]
-    equipment = load_equipments_and_configs(info['equipment'], [], [])
+    equipment = _load_equipment_cached(str(info['equipment']))
     network = load_network(info['topology'], equipment)
-    return equipment, network
-
-
-def _get_transceivers(network):
-    """Return a dict of {uid: node} for all Transceiver nodes."""
-    return {n.uid: n for n in network.nodes() if isinstance(n, Transceiver)}
+    transceivers = {n.uid: n for n in network.nodes() if type(n) is Transceiver}
+    return _CachedNetwork(equipment, network, transceivers, sorted(transceivers))
 
 
 # ---------------------------------------------------------------------------
@@ -82,7 +100,7 @@ def tutorial_1():
     st.info(NETWORKS[network_key]['description'])
 
     try:
-        equipment, network = _load_network_cached(network_key)
+        equipment, network, transceivers, trx_uids = _load_network_cached(network_key)
     except Exception as e:
         st.error(f"Failed to load network: {e}")
         return
@@ -92,18 +110,11 @@ def tutorial_1():
     nodes = list(network.nodes())
     edges = list(network.edges())
 
-    type_counts = {}
-    for node in nodes:
-        t = _element_type_name(node)
-        type_counts[t] = type_counts.get(t, 0) + 1
+    type_counts = Counter(map(_element_type_name, nodes))
 
-    col1, col2 = st.columns(2)
-    with col1:
-        st.metric("Total Nodes", len(nodes))
-        st.metric("Total Edges", len(edges))
-    with col2:
-        for t, count in sorted(type_counts.items()):
-            st.metric(t, count)
+    # Rendered as a single table rather than one widget per count
+    summary = [('Total Nodes', len(nodes)), ('Total Edges', len(edges))] + sorted(type_counts.items())
+    st.dataframe(pd.DataFrame(summary, columns=['Element', 'Count']), hide_index=True)
 
     # --- Equipment summary ---
     st.subheader("Equipment Summary")
@@ -119,26 +130,24 @@ def tutorial_1():
     # --- SI (Spectral Information) defaults ---
     si = equipment['SI']['default']
     st.subheader("Default Spectral Information (SI)")
-    si_col1, si_col2, si_col3 = st.columns(3)
-    with si_col1:
-        st.metric("Power (dBm)", "%.1f" % si.power_dbm)
-        st.metric("F_min (THz)", "%.3f" % (si.f_min * 1e-12))
-    with si_col2:
-        st.metric("F_max (THz)", "%.3f" % (si.f_max * 1e-12))
-        st.metric("Spacing (GHz)", "%.1f" % (si.spacing * 1e-9))
-    with si_col3:
-        st.metric("Roll-off", "%.2f" % si.roll_off)
-        st.metric("Baud rate (GBd)", "%.1f" % (si.baud_rate * 1e-9))
+    si_table = pd.DataFrame([
+        ('Power', "%.1f" % si.power_dbm, 'dBm'),
+        ('F_min', "%.3f" % (si.f_min * 1e-12), 'THz'),
+        ('F_max', "%.3f" % (si.f_max * 1e-12), 'THz'),
+        ('Spacing', "%.1f" % (si.spacing * 1e-9), 'GHz'),
+        ('Roll-off', "%.2f" % si.roll_off, ''),
+        ('Baud rate', "%.1f" % (si.baud_rate * 1e-9), 'GBd'),
+    ], columns=['Parameter', 'Value', 'Unit'])
+    st.dataframe(si_table, hide_index=True)
 
     # --- Network diagram ---
     st.subheader("Network Diagram")
-    _draw_network_diagram(network)
+    _draw_network_diagram(network, network_key)
 
     # --- Node listing ---
     st.subheader("Node Details")
-    transceivers = _get_transceivers(network)
     trx_count = len(transceivers)
-    trx_list = ', '.join(sorted(transceivers.keys()))
+    trx_list = ', '.join(trx_uids)
     st.write("**Transceivers (%d):** %s" % (trx_count, trx_list))
 
     with st.expander("All nodes", expanded=False):
@@ -147,14 +156,25 @@ def tutorial_1():
             st.write("- `%s` (%s)" % (node.uid, tname))
 
 
-def _draw_network_diagram(network):
-    """Draw a simple network diagram using plotly with a spring layout."""
+@st.cache_resource
+def _layout_for(network_key):
+    """Compute node positions for the cached network of a given example key.
+
+    Spring layout is an iterative force simulation, so it is computed once per network
+    rather than on every rerun. Positions are keyed by the cached node objects.
+    """
     import networkx as nx
 
+    network = _load_network_cached(network_key).network
     try:
-        pos = nx.spring_layout(network, seed=42)
+        return nx.spring_layout(network, seed=42)
     except Exception:
-        pos = nx.kamada_kawai_layout(network)
+        return nx.kamada_kawai_layout(network)
+
+
+def _draw_network_diagram(network, network_key):
+    """Draw a simple network diagram using plotly with a spring layout."""
+    pos = _layout_for(network_key)
 
     # Classify nodes by type for coloring
     color_map = {
@@ -166,50 +186,80 @@ def _draw_network_diagram(network):
         'Fused': '#607D8B',
     }
 
-    # Draw edges
-    edge_x, edge_y = [], []
-    for u, v in network.edges():
-        x0, y0 = pos[u]
-        x1, y1 = pos[v]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
+    nodes = list(network.nodes())
+    node_index = {n: i for i, n in enumerate(nodes)}
+    pos_arr = np.fromiter((v for n in nodes for v in pos[n]), dtype=np.float64, count=2 * len(nodes)).reshape(-1, 2)
 
-    edge_trace = go.Scatter(
+    # Draw edges as one polyline: (u, v, NaN) triplets, NaN breaking the line between segments
+    edges = list(network.edges())
+    u_idx = np.fromiter((node_index[u] for u, _ in edges), dtype=np.intp, count=len(edges))
+    v_idx = np.fromiter((node_index[v] for _, v in edges), dtype=np.intp, count=len(edges))
+    edge_x = np.full(3 * len(edges), np.nan)
+    edge_y = np.full(3 * len(edges), np.nan)
+    edge_x[0::3] = pos_arr[u_idx, 0]
+    edge_x[1::3] = pos_arr[v_idx, 0]
+    edge_y[0::3] = pos_arr[u_idx, 1]
+    edge_y[1::3] = pos_arr[v_idx, 1]
+
+    edge_trace = go.Scattergl(
         x=edge_x, y=edge_y,
         mode='lines',
         line=dict(width=1, color='#888'),
         hoverinfo='none',
+        showlegend=False,
+    )
+
+    # Draw all nodes as a single WebGL trace, colored and sized per element type. Nodes are sorted by type
+    # once, so that each type is a contiguous run and colors/sizes are expanded from one value per type.
+    labelled_types = ('Transceiver', 'Roadm')
+    node_types = np.array([_element_type_name(n) for n in nodes])
+    order = np.argsort(node_types, kind='stable')
+    node_types = node_types[order]
+    xs = pos_arr[order, 0]
+    ys = pos_arr[order, 1]
+    texts = np.array([n.uid for n in nodes], dtype=object)[order]
+    types, counts = np.unique(node_types, return_counts=True)
+    type_colors = [color_map.get(t, '#000000') for t in types]
+    type_sizes = [10 if t in labelled_types else 6 for t in types]
+
+    node_trace = go.Scattergl(
+        x=xs, y=ys,
+        mode='markers',
+        marker=dict(
+            size=np.repeat(type_sizes, counts),
+            color=np.repeat(type_colors, counts),
+        ),
+        text=texts,
+        customdata=node_types,
+        hovertemplate='%{text}<br>%{customdata}<extra></extra>',
+        showlegend=False,
     )
 
-    # Draw nodes grouped by type
-    node_traces = []
-    nodes_by_type = {}
-    for node in network.nodes():
-        t = _element_type_name(node)
-        nodes_by_type.setdefault(t, []).append(node)
-
-    for t, node_list in nodes_by_type.items():
-        xs = [pos[n][0] for n in node_list]
-        ys = [pos[n][1] for n in node_list]
-        texts = [n.uid for n in node_list]
-        color = color_map.get(t, '#000000')
-        # Only show text labels for Transceivers and Roadms
-        text_mode = 'markers+text' if t in ('Transceiver', 'Roadm') else 'markers'
-        trace = go.Scatter(
-            x=xs, y=ys,
-            mode=text_mode,
-            text=texts if t in ('Transceiver', 'Roadm') else None,
-            textposition='top center',
-            textfont=dict(size=9),
-            marker=dict(size=10 if t in ('Transceiver', 'Roadm') else 6, color=color),
+    # Only show text labels for Transceivers and Roadms
+    labelled = np.isin(node_types, labelled_types)
+    label_trace = go.Scattergl(
+        x=xs[labelled], y=ys[labelled],
+        mode='text',
+        text=texts[labelled],
+        textposition='top center',
+        textfont=dict(size=9),
+        hoverinfo='skip',
+        showlegend=False,
+    )
+
+    # Data-less traces that only provide one legend entry per element type
+    legend_traces = [
+        go.Scattergl(
+            x=[None], y=[None],
+            mode='markers',
+            marker=dict(size=size, color=color),
             name=t,
-            hovertext=texts,
-            hoverinfo='text',
         )
-        node_traces.append(trace)
+        for t, color, size in zip(types, type_colors, type_sizes)
+    ]
 
     fig = go.Figure(
-        data=[edge_trace] + node_traces,
+        data=[edge_trace, node_trace, label_trace] + legend_traces,
         layout=go.Layout(
             showlegend=True,
             hovermode='closest',
@@ -241,14 +291,11 @@ def tutorial_2():
     )
 
     try:
-        equipment, network = _load_network_cached(network_key)
+        trx_uids = _load_network_cached(network_key).trx_uids
     except Exception as e:
         st.error(f"Failed to load network: {e}")
         return
 
-    transceivers = _get_transceivers(network)
-    trx_uids = sorted(transceivers.keys())
-
     if len(trx_uids) < 2:
         st.error("Network needs at least 2 transceivers.")
         return
@@ -261,18 +308,16 @@ def tutorial_2():
         destination = st.selectbox("Destination transceiver", dest_options, key='t2_dst')
 
     if st.button("Run Simulation", key='t2_run'):
-        _run_simulation(equipment, network_key, source, destination)
-
+        _run_simulation(network_key, source, destination)
 
-def _run_simulation(equipment_orig, network_key, source, destination, power_dbm=None):
-    """Run a simulation and display results. Reloads network from scratch to avoid state issues."""
-    info = NETWORKS[network_key]
 
-    with st.spinner("Loading network and running simulation..."):
+def _run_simulation(network_key, source, destination, power_dbm=None):
+    """Run a simulation and display results. Works on a deep copy of the cached network to avoid state issues."""
+    with st.spinner("Running simulation..."):
         try:
-            # Reload a fresh network for each simulation to avoid mutation issues
-            equipment = load_equipments_and_configs(info['equipment'], [], [])
-            network = load_network(info['topology'], equipment)
+            # Design mutates the network, so work on a private copy of the cached objects
+            cached = _load_network_cached(network_key)
+            equipment, network = deepcopy((cached.equipment, cached.network))
             SimParams.set_params({})
 
             kwargs = {}
@@ -292,12 +337,13 @@ def _run_simulation(equipment_orig, network_key, source, destination, power_dbm=
     # Display results
     dest_node = path[-1]
 
-    # Summary metrics
+    # Summary metrics, computed once and reused in the returned summary
     st.subheader("Simulation Results")
+    avg_gsnr = avg_osnr = None
     if hasattr(dest_node, 'snr') and dest_node.snr is not None:
-        avg_gsnr = mean(dest_node.snr)
-        avg_osnr = mean(dest_node.osnr_ase)
-        avg_gsnr_01nm = mean(dest_node.snr_01nm)
+        avg_gsnr = float(np.asarray(dest_node.snr).mean())
+        avg_osnr = float(np.asarray(dest_node.osnr_ase).mean())
+        avg_gsnr_01nm = float(np.asarray(dest_node.snr_01nm).mean())
 
         m1, m2, m3 = st.columns(3)
         with m1:
@@ -326,9 +372,9 @@ def _run_simulation(equipment_orig, network_key, source, destination, power_dbm=
     _show_path_table(path)
 
     return {
-        'avg_gsnr': float(mean(dest_node.snr)) if dest_node.snr is not None else None,
-        'avg_osnr': float(mean(dest_node.osnr_ase)) if dest_node.osnr_ase is not None else None,
-        'path_length_km': sum(spans) / 1000,
+        'avg_gsnr': avg_gsnr,
+        'avg_osnr': avg_osnr,
+        'path_length_km': total_km,
         'num_elements': len(path),
         'num_spans': len(spans),
     }
@@ -341,21 +387,22 @@ def _plot_gsnr_spectrum(path, infos):
         st.warning("No SNR data available at destination.")
         return
 
-    freqs_thz = [c.frequency * 1e-12 for c in infos.carriers]
+    freqs_thz = np.fromiter((c.frequency for c in infos.carriers), dtype=np.float64,
+                            count=len(infos.carriers)) * 1e-12
 
     fig = go.Figure()
     fig.add_trace(go.Scatter(
-        x=freqs_thz, y=list(dest.snr),
+        x=freqs_thz, y=dest.snr,
         mode='lines+markers', name='GSNR (signal BW)',
         marker=dict(size=3),
     ))
     fig.add_trace(go.Scatter(
-        x=freqs_thz, y=list(dest.osnr_ase),
+        x=freqs_thz, y=dest.osnr_ase,
         mode='lines+markers', name='OSNR ASE (signal BW)',
         marker=dict(size=3),
     ))
     fig.add_trace(go.Scatter(
-        x=freqs_thz, y=list(dest.osnr_nli),
+        x=freqs_thz, y=dest.osnr_nli,
         mode='lines+markers', name='OSNR NLI (signal BW)',
         marker=dict(size=3),
     ))
@@ -371,28 +418,28 @@ def _plot_gsnr_spectrum(path, infos):
 def _plot_power_along_path(path):
     """Plot signal power at each element along the path."""
     element_names = []
-    power_dbm_vals = []
+    # Missing values are stored as NaN, which plotly renders as a gap
+    power_dbm_vals = np.full(len(path), np.nan)
 
     for elem in path:
         if hasattr(elem, 'pch_out_db'):
+            power_dbm_vals[len(element_names)] = np.nan if elem.pch_out_db is None else elem.pch_out_db
             element_names.append(elem.uid)
-            power_dbm_vals.append(elem.pch_out_db)
         elif isinstance(elem, Transceiver) and hasattr(elem, 'snr') and elem.snr is not None:
             # Final transceiver -- use carrier signal power
-            element_names.append(elem.uid)
             carriers = getattr(elem, '_carriers', None)
             if carriers:
-                power_dbm_vals.append(lin2db(carriers[0].signal * 1e3))
-            else:
-                power_dbm_vals.append(None)
+                power_dbm_vals[len(element_names)] = lin2db(carriers[0].signal * 1e3)
+            element_names.append(elem.uid)
 
-    if not power_dbm_vals or all(v is None for v in power_dbm_vals):
+    power_dbm_vals = power_dbm_vals[:len(element_names)]
+    if np.isnan(power_dbm_vals).all():
         st.info("Power-along-path data not available for this simulation.")
         return
 
     fig = go.Figure()
     fig.add_trace(go.Scatter(
-        x=list(range(len(element_names))),
+        x=np.arange(len(element_names)),
         y=power_dbm_vals,
         mode='lines+markers',
         name='Pch out (dBm)',
@@ -410,26 +457,18 @@ def _plot_power_along_path(path):
 
 def _show_path_table(path):
     """Show a table of path elements with their types."""
-    rows = []
-    for i, elem in enumerate(path):
-        row = {
-            'Index': i,
-            'UID': elem.uid,
-            'Type': _element_type_name(elem),
-        }
-        if isinstance(elem, (Fiber, RamanFiber)):
-            row['Length (km)'] = "%.1f" % (elem.params.length / 1000)
-        else:
-            row['Length (km)'] = '-'
-
-        if hasattr(elem, 'pch_out_db') and elem.pch_out_db is not None:
-            row['Pch out (dBm)'] = "%.2f" % elem.pch_out_db
-        else:
-            row['Pch out (dBm)'] = '-'
-
-        rows.append(row)
-
-    st.dataframe(rows, use_container_width=True)
+    table = pd.DataFrame({
+        'Index': np.arange(len(path)),
+        'UID': [elem.uid for elem in path],
+        'Type': [_element_type_name(elem) for elem in path],
+        'Length (km)': [elem.params.length / 1000 if isinstance(elem, (Fiber, RamanFiber)) else np.nan
+                        for elem in path],
+        'Pch out (dBm)': [np.nan if getattr(elem, 'pch_out_db', None) is None else elem.pch_out_db
+                          for elem in path],
+    })
+    # Numbers are formatted at render time, missing values shown as '-'
+    styled = table.style.format({'Length (km)': '{:.1f}', 'Pch out (dBm)': '{:.2f}'}, na_rep='-')
+    st.dataframe(styled, use_container_width=True)
 
 
 # ---------------------------------------------------------------------------
@@ -451,14 +490,11 @@ def tutorial_3():
     )
 
     try:
-        equipment, network = _load_network_cached(network_key)
+        equipment, _, _, trx_uids = _load_network_cached(network_key)
     except Exception as e:
         st.error(f"Failed to load network: {e}")
         return
 
-    transceivers = _get_transceivers(network)
-    trx_uids = sorted(transceivers.keys())
-
     if len(trx_uids) < 2:
         st.error("Network needs at least 2 transceivers.")
         return
@@ -490,12 +526,12 @@ def tutorial_3():
 
     if st.button("Compare", key='t3_compare'):
         st.subheader("Results with Power A = %.1f dBm" % power_a)
-        result_a = _run_simulation(equipment, network_key, source, destination, power_dbm=power_a)
+        result_a = _run_simulation(network_key, source, destination, power_dbm=power_a)
 
         st.markdown("---")
 
         st.subheader("Results with Power B = %.1f dBm" % power_b)
-        result_b = _run_simulation(equipment, network_key, source, destination, power_dbm=power_b)
+        result_b = _run_simulation(network_key, source, destination, power_dbm=power_b)
 
         # Comparison summary
         if result_a and result_b and result_a['avg_gsnr'] and result_b['avg_gsnr']:
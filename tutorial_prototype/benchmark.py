@@ -15,7 +15,11 @@ across three example networks.
 Run with: python tutorial_prototype/benchmark.py
 """
 
+import logging
+import multiprocessing
+import os
 import time
+import timeit
 import statistics
 from pathlib import Path
 
@@ -53,17 +57,45 @@ BENCHMARKS = {
 
 NUM_RUNS = 3
 
+# Phases faster than this (in ms) are re-timed with timeit autorange, if they can be repeated
+AUTORANGE_THRESHOLD_MS = 100
+
 
 def _find_transceivers(network):
-    """Return a list of transceiver UIDs."""
-    return [n.uid for n in network.nodes() if isinstance(n, Transceiver)]
+    """Return a list of transceiver UIDs, in graph order."""
+    return [n.uid for n in network.nodes() if type(n) is Transceiver]
+
+
+def _init_worker(cpu_sets, counter):
+    """Pool initializer: pin the worker to its own CPU set so that workers do not compete for cores.
+
+    Workers take the CPU sets in start order, from a shared counter. A worker started by the pool to
+    replace a dead one finds all the sets taken and is left unpinned.
+    """
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    if index < len(cpu_sets):
+        os.sched_setaffinity(0, cpu_sets[index])
+
 
+def _time_it(func, *args, repeatable=False, **kwargs):
+    """Run func and return (result, elapsed_ms).
 
-def _time_it(func, *args, **kwargs):
-    """Run func and return (result, elapsed_seconds)."""
-    start = time.perf_counter()
+    If repeatable is set (func has no side effects other than logging) and the run is faster than
+    AUTORANGE_THRESHOLD_MS, the elapsed time is instead averaged over as many extra runs as timeit autorange
+    needs. Logging is disabled during these extra runs, so that their warnings are only reported once.
+    """
+    start = time.perf_counter_ns()
     result = func(*args, **kwargs)
-    elapsed = time.perf_counter() - start
+    elapsed = (time.perf_counter_ns() - start) * 1e-6
+    if repeatable and elapsed < AUTORANGE_THRESHOLD_MS:
+        logging.disable(logging.WARNING)
+        try:
+            number, total = timeit.Timer(lambda: func(*args, **kwargs)).autorange()
+        finally:
+            logging.disable(logging.NOTSET)
+        elapsed = total / number * 1e3
     return result, elapsed
 
 
@@ -79,29 +111,29 @@ def benchmark_network(name, config):
         'transmission_sim': [],
     }
 
+    # Simulation parameters are the same for every run: parse them once
+    sim_params = load_json(config['sim_params']) if config['sim_params'] else {}
+    # Every run reloads the same topology, so source/destination are resolved on the first run only
+    source = config['source']
+    destination = config['destination']
+
     for run in range(NUM_RUNS):
         # Phase 1: Equipment load
         equipment, t_eqpt = _time_it(
-            load_equipments_and_configs, config['equipment'], [], []
+            load_equipments_and_configs, config['equipment'], [], [], repeatable=True
         )
         results['equipment_load'].append(t_eqpt)
 
         # Phase 2: Network load
         network, t_net = _time_it(
-            load_network, config['topology'], equipment
+            load_network, config['topology'], equipment, repeatable=True
         )
         results['network_load'].append(t_net)
 
         # Phase 3: Set SimParams
-        if config['sim_params']:
-            sim_params = load_json(config['sim_params'])
-        else:
-            sim_params = {}
         SimParams.set_params(sim_params)
 
         # Find source/destination
-        source = config['source']
-        destination = config['destination']
         if source is None or destination is None:
             trx_uids = _find_transceivers(network)
             if len(trx_uids) < 2:
@@ -135,13 +167,13 @@ def benchmark_network(name, config):
 
 
 def _fmt(values):
-    """Format a list of times as mean +/- std in milliseconds."""
+    """Format a list of times in milliseconds as mean +/- std."""
     clean = [v for v in values if v == v]  # filter NaN
     if not clean:
         return "N/A"
-    m = statistics.mean(clean) * 1000
+    m = statistics.mean(clean)
     if len(clean) > 1:
-        s = statistics.stdev(clean) * 1000
+        s = statistics.stdev(clean)
         return "%8.1f +/- %6.1f ms" % (m, s)
     return "%8.1f ms" % m
 
@@ -152,12 +184,27 @@ def main():
     print(f"Running {NUM_RUNS} iterations per measurement")
     print("=" * 80)
 
-    all_results = {}
-
-    for name, config in BENCHMARKS.items():
-        print(f"\n--- Benchmarking: {name} ---")
-        results = benchmark_network(name, config)
-        all_results[name] = results
+    # Networks are benchmarked in parallel processes, at most one per available CPU, so that the workers
+    # do not compete for cores. This needs CPU pinning (sched_getaffinity, Linux only): otherwise, or with
+    # a single CPU, they are benchmarked one after the other in this process.
+    cpus = sorted(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else []
+    nb_workers = min(len(BENCHMARKS), len(cpus) or os.cpu_count() or 1)
+    if nb_workers == 1 or not cpus:
+        print(f"\n--- Benchmarking {', '.join(BENCHMARKS)} serially ---")
+        all_results = {name: benchmark_network(name, config) for name, config in BENCHMARKS.items()}
+    else:
+        # Math libraries are limited to one thread per worker (the variables are inherited by the
+        # spawned processes) and each worker is pinned to a disjoint, non-empty CPU set
+        for var in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS'):
+            os.environ.setdefault(var, '1')
+        cpu_sets = [set(cpus[i::nb_workers]) for i in range(nb_workers)]
+        # spawn avoids fork + NumPy/OpenMP deadlocks
+        ctx = multiprocessing.get_context('spawn')
+        counter = ctx.Value('i', 0)
+
+        print(f"\n--- Benchmarking {', '.join(BENCHMARKS)} in {nb_workers} parallel processes ---")
+        with ctx.Pool(nb_workers, initializer=_init_worker, initargs=(cpu_sets, counter)) as pool:
+            all_results = dict(zip(BENCHMARKS, pool.starmap(benchmark_network, BENCHMARKS.items())))
 
     # Print formatted results table
     print("\n" + "=" * 80)
@@ -194,7 +241,7 @@ def main():
             if clean:
                 total_vals.append(statistics.mean(clean))
         if total_vals:
-            total_ms = sum(total_vals) * 1000
+            total_ms = sum(total_vals)
             row += "%*.1f ms" % (col_width - 3, total_ms)
         else:
             row += "%*s" % (col_width, "N/A")